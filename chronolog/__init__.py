@@ -1,5 +1,29 @@
 """A custom logging utility for Python applications."""
 
-from .logger import PrefixedLogger, get_prefixed_logger
+from .handlers import (
+    AsyncRotatingFileHandler,
+    BatchedRotatingFileHandler,
+    UringRotatingFileHandler,
+)
+from .logger import (
+    CachedTimeFormatter,
+    FastPrefixedLogger,
+    PrefixedLogger,
+    clear_prefixed_logger_cache,
+    get_fast_prefixed_logger,
+    get_prefixed_logger,
+    prewarm_loggers,
+)
 
-__all__ = ["PrefixedLogger", "get_prefixed_logger"]
+__all__ = [
+    "AsyncRotatingFileHandler",
+    "BatchedRotatingFileHandler",
+    "CachedTimeFormatter",
+    "FastPrefixedLogger",
+    "PrefixedLogger",
+    "UringRotatingFileHandler",
+    "clear_prefixed_logger_cache",
+    "get_fast_prefixed_logger",
+    "get_prefixed_logger",
+    "prewarm_loggers",
+]
@@ -0,0 +1,379 @@
+"""
+Logging handlers used by chronolog's background queue listener.
+"""
+
+import glob
+import itertools
+import os
+import queue
+import threading
+import warnings
+import weakref
+from logging.handlers import RotatingFileHandler
+
+# Handlers whose threads and buffers are reset in a forked child, see _reinit_handlers_after_fork
+_fork_reinit_handlers = weakref.WeakSet()
+
+
+def _reinit_handlers_after_fork():
+    """
+    Reset the handlers inherited by a forked child: threads do not survive fork(), and buffered
+    records and pending rotations belong to the parent, which writes them itself.
+    """
+    for handler in list(_fork_reinit_handlers):
+        handler._reinit_after_fork()
+
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_reinit_handlers_after_fork)
+
+
+class AsyncRotatingFileHandler(RotatingFileHandler):
+    """
+    A RotatingFileHandler that shifts backup files on a dedicated rotation thread.
+
+    On rollover the full log file is moved aside with a single rename and a fresh file is opened
+    right away, so logging is only blocked for that rename. Renaming the backups, and running a
+    custom `rotator` (e.g. one that compresses), happens on the rotation thread, in order.
+    """
+
+    def __init__(self, filename, *args, **kwargs):
+        super().__init__(filename, *args, **kwargs)
+        self._rotations = queue.SimpleQueue()
+        self._rotation_ids = itertools.count()
+        self._rotation_thread = None  # Started on the first rollover
+        _fork_reinit_handlers.add(self)
+        if self.backupCount > 0:
+            self._queue_leftover_rotations()
+
+    def _queue_leftover_rotations(self):
+        """
+        Queue files moved aside by a process that exited before its rotation thread shifted them
+        into the backups, oldest first, so they are not lost and count toward backupCount.
+        """
+        leftovers = glob.glob(f"{glob.escape(self.baseFilename)}.rotating.*")
+        for rotated in sorted(leftovers, key=os.path.getmtime):
+            self._queue_rotation(rotated)
+
+    def _reinit_after_fork(self):
+        """Forget the parent's pending rotations, the rotation thread is started again when needed."""
+        self._rotations = queue.SimpleQueue()
+        self._rotation_thread = None
+
+    def doRollover(self):
+        """Move the full file aside, reopen the log file and leave the backups to the rotation thread."""
+        if self.backupCount <= 0:
+            super().doRollover()
+            return
+        if self.stream:
+            self.stream.close()
+            self.stream = None
+        if os.path.exists(self.baseFilename):
+            # The pid keeps names unique across processes, e.g. after a restart that found leftovers
+            rotated = (
+                f"{self.baseFilename}.rotating.{os.getpid()}.{next(self._rotation_ids)}"
+            )
+            os.replace(self.baseFilename, rotated)
+            self._queue_rotation(rotated)
+        if not self.delay:
+            self.stream = self._open()
+
+    def _queue_rotation(self, rotated):
+        """Hand a file moved aside to the rotation thread, starting the thread if needed."""
+        if self._rotation_thread is None:
+            self._rotation_thread = threading.Thread(
+                target=self._rotate_worker,
+                name="chronolog-rotation",
+                daemon=True,
+            )
+            self._rotation_thread.start()
+        self._rotations.put(rotated)
+
+    def _rotate_worker(self):
+        # Files whose shift failed, oldest first. They stay on disk and are retried, in order,
+        # on the next rollover; after a restart the leftover scan picks them up.
+        pending = []
+        while True:
+            rotated = self._rotations.get()
+            if rotated is None:
+                return
+            pending.append(rotated)
+            while pending:
+                try:
+                    self._shift_backups(pending[0])
+                except Exception as e:
+                    warnings.warn(
+                        f"Could not move rotated log file {pending[0]!r} into the backups, "
+                        f"retrying on the next rollover: {e}",
+                        RuntimeWarning,
+                    )
+                    break
+                pending.pop(0)
+
+    def _shift_backups(self, rotated):
+        """Shift the numbered backups up by one and move `rotated` into place as backup 1."""
+        for i in range(self.backupCount - 1, 0, -1):
+            source = self.rotation_filename(f"{self.baseFilename}.{i}")
+            dest = self.rotation_filename(f"{self.baseFilename}.{i + 1}")
+            if os.path.exists(source):
+                os.replace(source, dest)
+        dest = self.rotation_filename(f"{self.baseFilename}.1")
+        # Left in place with backupCount=1, the default rotator's os.rename fails on Windows if it exists
+        if os.path.exists(dest):
+            os.remove(dest)
+        self.rotate(rotated, dest)
+
+    def close(self):
+        """Wait for pending rotations, then close the file."""
+        thread = self._rotation_thread
+        if thread is not None and thread is not threading.current_thread():
+            self._rotation_thread = None
+            self._rotations.put(None)
+            thread.join()
+        super().close()
+
+
+class BatchedRotatingFileHandler(AsyncRotatingFileHandler):
+    """
+    An AsyncRotatingFileHandler that buffers formatted records and writes them in batches.
+
+    Buffered records are written with a single write() and flush() when the buffer holds
+    `capacity` records, every `flush_interval` seconds, or when flush() is called explicitly.
+    """
+
+    def __init__(self, filename, *args, capacity=64, flush_interval=0.1, **kwargs):
+        """
+        Args:
+            filename: Path to the log file.
+            *args, **kwargs: Passed on to RotatingFileHandler (mode, maxBytes, backupCount, ...).
+            capacity: Number of buffered records that triggers a write.
+            flush_interval: Seconds between background flushes of a partially filled buffer.
+                            None disables the background flush thread.
+        """
+        super().__init__(filename, *args, **kwargs)
+        self.capacity = capacity
+        self.flush_interval = flush_interval
+        self._buffer = []
+        self._last_record = None  # Reported by handleError if a batch write fails
+
+        self._closing = threading.Event()
+        self._flusher = None
+        if flush_interval:
+            self._start_flusher()
+
+    def _start_flusher(self):
+        self._flusher = threading.Thread(
+            target=self._flush_periodically,
+            name="chronolog-batched-flush",
+            daemon=True,
+        )
+        self._flusher.start()
+
+    def _reinit_after_fork(self):
+        """Drop the records buffered by the parent and restart the flush thread."""
+        super()._reinit_after_fork()
+        self._buffer.clear()
+        if self._flusher is not None and not self._closing.is_set():
+            self._closing = threading.Event()
+            self._start_flusher()
+
+    def _flush_periodically(self):
+        while not self._closing.wait(self.flush_interval):
+            self.flush()
+
+    def emit(self, record):
+        """Format the record into the buffer, writing the batch if the buffer is full."""
+        try:
+            self._buffer.append(self.format(record) + self.terminator)
+        except Exception:
+            self.handleError(record)
+            return
+        self._last_record = record
+        if len(self._buffer) >= self.capacity:
+            self.flush()
+
+    def flush(self):
+        """Write all buffered records with a single write, rotating the file first if needed."""
+        self.acquire()
+        try:
+            if not self._buffer:
+                return
+            data = "".join(self._buffer)
+            self._buffer.clear()
+            try:
+                if self.stream is None:
+                    self.stream = self._open()
+                if self._should_rollover_batch(data):
+                    self.doRollover()
+                    if self.stream is None:
+                        self.stream = self._open()
+                self._write_batch(data)
+            except Exception:
+                self.handleError(self._last_record)
+        finally:
+            self.release()
+
+    def _write_batch(self, data):
+        """Write a joined batch of formatted records to the open stream."""
+        self.stream.write(data)
+        self.stream.flush()
+
+    def _file_size(self):
+        """Size of the current log file, including everything written so far."""
+        # Non-posix-compliant Windows feature, as in RotatingFileHandler
+        self.stream.seek(0, 2)
+        return self.stream.tell()
+
+    def _should_rollover_batch(self, data):
+        """Check if writing `data` would take the current file past maxBytes."""
+        if self.maxBytes <= 0:
+            return False
+        # As in RotatingFileHandler (bpo-45401): pipes, FIFOs and devices like /dev/stdout never roll over
+        if os.path.exists(self.baseFilename) and not os.path.isfile(self.baseFilename):
+            return False
+        size = self._file_size()
+        return size > 0 and size + len(data) >= self.maxBytes
+
+    def close(self):
+        """Stop the background flush thread, write any buffered records and close the file."""
+        self._closing.set()
+        if (
+            self._flusher is not None
+            and self._flusher is not threading.current_thread()
+        ):
+            self._flusher.join()
+        self.flush()
+        super().close()
+
+
+class UringRotatingFileHandler(BatchedRotatingFileHandler):
+    """
+    A BatchedRotatingFileHandler that submits each batch as an io_uring write (Linux only).
+
+    A batch's write is submitted without waiting for it, its completion is collected when the
+    next batch is written, so the kernel performs the I/O while the next batch is formatted.
+    Rotation works as in RotatingFileHandler.
+
+    Requires the `liburing` package. Without it, or if the kernel refuses to create the ring,
+    batches are written like in BatchedRotatingFileHandler.
+    """
+
+    def __init__(self, filename, *args, sqpoll=False, **kwargs):
+        """
+        Args:
+            filename: Path to the log file.
+            *args, **kwargs: Passed on to BatchedRotatingFileHandler.
+            sqpoll: Create the ring with IORING_SETUP_SQPOLL, so a kernel thread picks up
+                    submissions without a syscall. It only pays off with a spare CPU core for
+                    that thread; falls back to a regular ring if the kernel refuses.
+        """
+        self._liburing = None
+        self._ring = None
+        self._cqe = None
+        # (payload, offset) of the write in flight, the payload is kept alive until it completes
+        self._pending = None
+        # Size of the current file, read with os.fstat after each (re)open
+        self._size = None
+        self._sqpoll = sqpoll
+        super().__init__(filename, *args, **kwargs)
+        # Created once the file is open, so a failing open does not leak the ring
+        self._open_ring(sqpoll)
+
+    def _reinit_after_fork(self):
+        """Replace the ring shared with the parent, whose write in flight is the parent's to collect."""
+        super()._reinit_after_fork()
+        self._pending = None
+        self._size = None
+        if self._ring is not None:
+            # Only unmaps the ring and closes its descriptor in this process
+            self._liburing.io_uring_queue_exit(self._ring)
+            self._ring = None
+            self._open_ring(self._sqpoll)
+            if self._ring is None and self.stream is not None:
+                # Falling back to stream writes, which must append after the ring's writes
+                self.stream.seek(0, 2)
+
+    def _open_ring(self, sqpoll):
+        """Create the io_uring ring, leaving it None if liburing or the kernel support is missing."""
+        try:
+            import liburing
+        except ImportError:
+            return
+        ring = liburing.Ring()
+        # SQPOLL needs privileges on older kernels, retry without it
+        for flags in (liburing.IORING_SETUP_SQPOLL, 0) if sqpoll else (0,):
+            try:
+                liburing.io_uring_queue_init(8, ring, flags)
+                break
+            except OSError:
+                pass
+        else:
+            return
+        self._liburing = liburing
+        self._cqe = liburing.Cqe()
+        self._ring = ring
+
+    def _write_batch(self, data):
+        if self._ring is None:
+            super()._write_batch(data)
+            return
+        self._wait_for_write()
+        payload = data.encode(self.stream.encoding, self.stream.errors)
+        # Written at an explicit offset, the file is not necessarily opened in append mode (mode="w")
+        offset = self._file_size()
+        self._size = offset + len(payload)
+        liburing = self._liburing
+        sqe = liburing.io_uring_get_sqe(self._ring)
+        liburing.io_uring_prep_write(sqe, self.stream.fileno(), payload, offset)
+        liburing.io_uring_submit(self._ring)
+        self._pending = (payload, offset)
+
+    def _wait_for_write(self):
+        """Wait for the write in flight, completing it with regular writes if it was short."""
+        if self._pending is None:
+            return
+        payload, offset = self._pending
+        self._pending = None
+        liburing = self._liburing
+        liburing.io_uring_wait_cqe(self._ring, self._cqe)
+        entry = self._cqe[0]
+        result = entry.res
+        liburing.io_uring_cqe_seen(self._ring, entry)
+        written = liburing.trap_error(result)  # Raises OSError for a failed write
+        remaining = memoryview(payload)[written:]
+        offset += written
+        while remaining:
+            written = os.pwrite(self.stream.fileno(), remaining, offset)
+            remaining = remaining[written:]
+            offset += written
+
+    def _file_size(self):
+        if self._ring is None:
+            return super()._file_size()
+        # Tracked from submitted writes, the file itself lags behind while a write is in flight
+        if self._size is None:
+            self._size = os.fstat(self.stream.fileno()).st_size
+        return self._size
+
+    def doRollover(self):
+        """Wait for the write in flight to the current file, then rotate it."""
+        self._wait_for_write()
+        super().doRollover()
+        self._size = None
+
+    def flush(self):
+        super().flush()
+        if self._closing.is_set():
+            # The file must not be closed with a write still in flight
+            self.acquire()
+            try:
+                self._wait_for_write()
+            finally:
+                self.release()
+
+    def close(self):
+        """Write any buffered records, close the file and release the ring."""
+        super().close()
+        if self._ring is not None:
+            self._liburing.io_uring_queue_exit(self._ring)
+            self._ring = None
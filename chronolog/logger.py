@@ -4,84 +4,374 @@ A custom logging utility that provides a centralized logging configuration that
 all log messages with a given string. It also includes special "beacon" logging for timing operations.
 """
 
+import atexit
+import functools
+import io
 import logging
+import os
+import queue
+import sys
+import threading
 import time
-from logging.handlers import RotatingFileHandler
-
-# Import Google Cloud Logging components conditionally to avoid eager initialization
-# This ensures that `google.cloud.logging.Client()` is not called at module import time
-# unless explicitly enabled later.
-try:
-    import google.cloud.logging
-    from google.cloud.logging.handlers import CloudLoggingHandler
-
-    _GOOGLE_CLOUD_LOGGING_AVAILABLE = True
-except ImportError:
-    _GOOGLE_CLOUD_LOGGING_AVAILABLE = False
-    print(
-        "Warning: google-cloud-logging not installed. Google Cloud Logging functionality will be disabled."
-    )
-except Exception as e:
-    _GOOGLE_CLOUD_LOGGING_AVAILABLE = False
-    print(
-        f"Warning: Failed to import google.cloud.logging: {e}. Google Cloud Logging functionality will be disabled."
-    )
+import warnings
+from array import array
+from logging.handlers import QueueHandler, QueueListener
 
+from .handlers import BatchedRotatingFileHandler, UringRotatingFileHandler
 
 # Module-level flag to ensure logging setup runs only once
 _logging_configured = False
 
+_LOG_FORMAT = "%(asctime)s - %(levelname)s - %(message)s"
+
+# Loggers are never discarded by `logging`, so lookups can be memoized. A cache hit is a C-level
+# dict lookup instead of `logging.getLogger`, which takes the logging module lock on every call.
+_get_logger = functools.lru_cache(maxsize=None)(logging.getLogger)
+
+
+@functools.lru_cache(maxsize=None)
+def _logger_methods(logger_name):
+    """
+    The logger for `logger_name` followed by the bound methods PrefixedLogger keeps, in the
+    order PrefixedLogger.__init__ unpacks them. Cached, so constructing a PrefixedLogger copies
+    them instead of binding every method again.
+    """
+    logger = _get_logger(logger_name)
+    return (
+        logger,
+        logger.info,
+        logger.debug,
+        logger.warning,
+        logger.error,
+        logger.critical,
+        logger.exception,
+        logger.isEnabledFor,
+    )
+
+
+# Google Cloud Logging module and handler class, imported by _import_google_cloud_logging on first use
+_google_cloud_logging = None
+_google_cloud_logging_import_failed = False
+# Set when `google.cloud.logging.Client()` fails, it is slow to fail (credential lookup) and is not retried
+_google_cloud_client_failed = False
+
+# Background listener feeding the file and cloud handlers, and the root handler feeding it
+_queue_listener = None
+_queue_handler = None
+# Console handler added to the root logger by setup_logging, replaced on reconfiguration
+_stream_handler = None
+
+# Cached level constants, avoids attribute lookups on the `logging` module in the hot path
+_DEBUG = logging.DEBUG
+_INFO = logging.INFO
+_WARNING = logging.WARNING
+_ERROR = logging.ERROR
+_CRITICAL = logging.CRITICAL
+
+# Clock for beacon timers: monotonic, so elapsed times are not affected by system clock changes,
+# and integer nanoseconds avoid a float allocation per reading
+_now = time.monotonic_ns
+
+
+def _import_google_cloud_logging():
+    """
+    Import Google Cloud Logging components on first use.
+    This keeps `google.cloud.logging` and its grpc/protobuf dependencies out of the import
+    of this module, so processes that only log locally never load them.
+
+    Returns:
+        A (google.cloud.logging, CloudLoggingHandler) tuple, or None if the import failed.
+    """
+    global _google_cloud_logging, _google_cloud_logging_import_failed
+    if _google_cloud_logging is None and not _google_cloud_logging_import_failed:
+        try:
+            import google.cloud.logging
+            from google.cloud.logging.handlers import CloudLoggingHandler
+
+            _google_cloud_logging = (google.cloud.logging, CloudLoggingHandler)
+        except ImportError:
+            _google_cloud_logging_import_failed = True
+            warnings.warn(
+                "google-cloud-logging not installed. Google Cloud Logging functionality will be disabled.",
+                RuntimeWarning,
+                stacklevel=3,
+            )
+        except Exception as e:
+            _google_cloud_logging_import_failed = True
+            warnings.warn(
+                f"Failed to import google.cloud.logging: {e}. Google Cloud Logging functionality will be disabled.",
+                RuntimeWarning,
+                stacklevel=3,
+            )
+    return _google_cloud_logging
+
+
+class CachedTimeFormatter(logging.Formatter):
+    """
+    A Formatter that renders the date and time of `%(asctime)s` once per second.
+
+    `logging.Formatter.formatTime` calls `time.localtime` and `time.strftime` for every record,
+    this formatter reuses the rendered second for all records created within it.
+    An explicit `datefmt` is not cached and is rendered by `logging.Formatter` as usual.
+    """
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        # (second, rendered second) pair, replaced as a whole so concurrent handlers never see a torn update
+        self._cached_second = (None, "")
+
+    def formatTime(self, record, datefmt=None):
+        if datefmt is not None:
+            return super().formatTime(record, datefmt)
+        rendered = self._render_second(int(record.created))
+        if self.default_msec_format:
+            return self.default_msec_format % (rendered, record.msecs)
+        return rendered
+
+    def _render_second(self, second):
+        """Render a whole second since the epoch with the default time format, cached."""
+        cached = self._cached_second
+        if cached[0] != second:
+            rendered = time.strftime(self.default_time_format, self.converter(second))
+            cached = self._cached_second = (second, rendered)
+        return cached[1]
+
+
+class _DropOldestQueueHandler(QueueHandler):
+    """A QueueHandler for bounded queues that discards the oldest queued record when full."""
+
+    def enqueue(self, record):
+        while True:
+            try:
+                self.queue.put_nowait(record)
+                return
+            except queue.Full:
+                try:
+                    self.queue.get_nowait()
+                except queue.Empty:
+                    pass
+
+
+class _QueueListener(QueueListener):
+    """
+    A QueueListener that writes batched file handlers out whenever it has drained the queue,
+    and waits for room in a bounded queue when stopping.
+    """
+
+    def __init__(self, queue, *handlers, respect_handler_level=False):
+        super().__init__(queue, *handlers, respect_handler_level=respect_handler_level)
+        self._batched_handlers = [
+            h for h in handlers if isinstance(h, BatchedRotatingFileHandler)
+        ]
+
+    def handle(self, record):
+        super().handle(record)
+        # Under load records pile up in the queue and are written `capacity` at a time,
+        # once the burst is over the partial batch is written without waiting for the flush interval.
+        if self._batched_handlers and self.queue.empty():
+            for handler in self._batched_handlers:
+                handler.flush()
+
+    def enqueue_sentinel(self):
+        self.queue.put(self._sentinel)
+
+
+def _stop_queue_listener():
+    """
+    Detach the queue handler from the root logger and stop the background listener.
+    Records already queued are handed to the file and cloud handlers, which are then closed.
+    """
+    global _queue_listener, _queue_handler
+    if _queue_handler is not None:
+        logging.getLogger().removeHandler(_queue_handler)
+        _queue_handler = None
+    if _queue_listener is not None:
+        _queue_listener.stop()
+        for handler in _queue_listener.handlers:
+            handler.close()
+        _queue_listener = None
+
+
+# Flush pending records on interpreter shutdown, runs before `logging.shutdown` closes the handlers
+atexit.register(_stop_queue_listener)
+
+
+def _make_record_queue(maxsize):
+    """Queue for the background listener, bounded if `maxsize` is set."""
+    if maxsize:
+        return queue.Queue(maxsize=maxsize)
+    # SimpleQueue has a lock-free put, the common unbounded case
+    return queue.SimpleQueue()
+
+
+def _restart_queue_listener_after_fork():
+    """
+    Give a forked child its own queue and listener thread, the parent's thread does not survive fork().
+    Records the parent had queued are left to the parent, so they are not written twice.
+    The queued handlers reset their own threads and buffers, see chronolog.handlers.
+    """
+    global _queue_listener
+    if _queue_listener is None:
+        return
+    record_queue = _make_record_queue(getattr(_queue_listener.queue, "maxsize", None))
+    _queue_handler.queue = record_queue
+    _queue_listener = _QueueListener(
+        record_queue,
+        *_queue_listener.handlers,
+        respect_handler_level=_queue_listener.respect_handler_level,
+    )
+    _queue_listener.start()
+
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_restart_queue_listener_after_fork)
+
+
+class _ThreadTimers(threading.local):
+    """Beacon start times of the current thread, keyed by beacon key."""
+
+    def __init__(self):
+        self.timers = {}
+
+
+# Guards the lazy creation of PrefixedLogger._start_times, so concurrent first log_start calls share it
+_thread_timers_lock = threading.Lock()
+
 
 class PrefixedLogger:
     """A logger wrapper that automatically prefixes messages with a given string."""
 
-    def __init__(self, logger_name, prefix=None):
-        self.logger = logging.getLogger(logger_name)
-        self._prefix = prefix or "no-prefix"
-        self._start_times = {}  # For beacon timers
+    __slots__ = (
+        "logger",
+        "_prefix",
+        "_prefix_fmt",
+        "_start_times",
+        "_slot_times",
+        "_info",
+        "_debug",
+        "_warning",
+        "_error",
+        "_critical",
+        "_exception",
+        "_is_enabled",
+    )
 
-    def _format_message(self, message):
-        """Add prefix to the message."""
-        return f"[{self._prefix}] {message}"
+    def __init__(self, logger_name, prefix=None, beacon_slots=0):
+        """
+        Args:
+            logger_name: Name of the underlying logger.
+            prefix: The string to prefix messages with.
+            beacon_slots: Number of preallocated timer slots for log_start_fast/log_end_fast.
+        """
+        # Bound methods of the underlying logger, saves attribute lookups on every call
+        (
+            self.logger,
+            self._info,
+            self._debug,
+            self._warning,
+            self._error,
+            self._critical,
+            self._exception,
+            self._is_enabled,
+        ) = _logger_methods(logger_name)
+        self.update_prefix(prefix)
+        # Beacon timers, separate per thread. Created by the first log_start, most loggers never time anything
+        self._start_times = None
+        # Only allocated when slots are requested, 0 marks an unstarted slot
+        self._slot_times = array("q", [0]) * beacon_slots if beacon_slots else None
 
     def update_prefix(self, prefix):
         """Update the prefix for log messages."""
         self._prefix = prefix or "no-prefix"
+        self._prefix_fmt = f"[{self._prefix}] "
+
+    # The level methods only forward *args/**kwargs when there are any: calling the logger with
+    # empty `*args, **kwargs` still builds a new tuple and dict for the callee.
 
     def info(self, message, *args, **kwargs):
         """Log an info message with prefix."""
-        self.logger.info(self._format_message(message), *args, **kwargs)
+        if self._is_enabled(_INFO):
+            if args or kwargs:
+                self._info(f"{self._prefix_fmt}{message}", *args, **kwargs)
+            else:
+                self._info(f"{self._prefix_fmt}{message}")
 
     def debug(self, message, *args, **kwargs):
         """Log a debug message with prefix."""
-        self.logger.debug(self._format_message(message), *args, **kwargs)
+        if self._is_enabled(_DEBUG):
+            if args or kwargs:
+                self._debug(f"{self._prefix_fmt}{message}", *args, **kwargs)
+            else:
+                self._debug(f"{self._prefix_fmt}{message}")
 
     def warning(self, message, *args, **kwargs):
         """Log a warning message with prefix."""
-        self.logger.warning(self._format_message(message), *args, **kwargs)
+        if self._is_enabled(_WARNING):
+            if args or kwargs:
+                self._warning(f"{self._prefix_fmt}{message}", *args, **kwargs)
+            else:
+                self._warning(f"{self._prefix_fmt}{message}")
 
     def error(self, message, *args, **kwargs):
         """Log an error message with prefix."""
-        self.logger.error(self._format_message(message), *args, **kwargs)
+        if self._is_enabled(_ERROR):
+            if args or kwargs:
+                self._error(f"{self._prefix_fmt}{message}", *args, **kwargs)
+            else:
+                self._error(f"{self._prefix_fmt}{message}")
 
     def critical(self, message, *args, **kwargs):
         """Log a critical message with prefix."""
-        self.logger.critical(self._format_message(message), *args, **kwargs)
+        if self._is_enabled(_CRITICAL):
+            if args or kwargs:
+                self._critical(f"{self._prefix_fmt}{message}", *args, **kwargs)
+            else:
+                self._critical(f"{self._prefix_fmt}{message}")
 
     def exception(self, message, *args, **kwargs):
         """Log an exception message with prefix."""
-        self.logger.exception(self._format_message(message), *args, **kwargs)
+        if self._is_enabled(_ERROR):
+            if args or kwargs:
+                self._exception(f"{self._prefix_fmt}{message}", *args, **kwargs)
+            else:
+                self._exception(f"{self._prefix_fmt}{message}")
+
+    def _log_beacon_start(self, key, message, args, kwargs):
+        if self._is_enabled(_INFO):
+            beacon_message = f"{self._prefix_fmt}(BEACON - [{key}] - START) {message}"
+            self._info(beacon_message, *args, **kwargs)
+
+    def _log_beacon_end(self, key, start_time, end_time, message, args, kwargs):
+        if start_time is None:
+            self.warning(
+                f"log_end called for key '{key}' without a corresponding log_start."
+            )
+        if not self._is_enabled(_INFO):
+            return
+        if start_time is None:
+            beacon_message = f"{self._prefix_fmt}(BEACON - [{key}] - END (Elapsed time N/A s)) {message}"
+        else:
+            elapsed_time = (end_time - start_time) / 1_000_000_000
+            beacon_message = f"{self._prefix_fmt}(BEACON - [{key}] - END (Elapsed time {elapsed_time:.2f} s)) {message} "
+        self._info(beacon_message, *args, **kwargs)
 
     def log_start(self, key, message, *args, **kwargs):
         """
         Logs a START beacon for a timed operation.
+        Timers are kept per thread, the matching log_end must be called from the same thread.
         Args:
             key: A unique string key to identify the operation.
             message: The log message.
         """
-        self._start_times[key] = time.time()
-        beacon_message = f"(BEACON - [{key}] - START) {message}"
-        self.info(beacon_message, *args, **kwargs)
+        start_times = self._start_times
+        if start_times is None:
+            with _thread_timers_lock:
+                if self._start_times is None:
+                    self._start_times = _ThreadTimers()
+                start_times = self._start_times
+        # The timer is always recorded, so log_end works even if INFO is enabled in between
+        start_times.timers[key] = _now()
+        self._log_beacon_start(key, message, args, kwargs)
 
     def log_end(self, key, message, *args, **kwargs):
         """
@@ -90,16 +380,134 @@ class PrefixedLogger:
             key: The unique string key used in log_start.
             message: The log message.
         """
-        start_time = self._start_times.pop(key, None)
-        if start_time is None:
-            self.warning(
-                f"log_end called for key '{key}' without a corresponding log_start."
+        end_time = _now()
+        start_times = self._start_times
+        start_time = None if start_times is None else start_times.timers.pop(key, None)
+        self._log_beacon_end(key, start_time, end_time, message, args, kwargs)
+
+    def log_start_fast(self, slot, message, *args, **kwargs):
+        """
+        Logs a START beacon timed in a preallocated slot instead of the key dictionary.
+        Requires the logger to be created with `beacon_slots` greater than `slot`.
+        Unlike log_start timers, slots are shared by all threads using this logger.
+        Args:
+            slot: Index of the timer slot, shown as the beacon key.
+            message: The log message.
+        """
+        # Negative indexes would silently alias the last slots
+        if slot < 0 or self._slot_times is None:
+            raise IndexError(f"beacon slot {slot} out of range")
+        self._slot_times[slot] = _now()
+        self._log_beacon_start(slot, message, args, kwargs)
+
+    def log_end_fast(self, slot, message, *args, **kwargs):
+        """
+        Logs an END beacon for a slot started with log_start_fast and reports the elapsed time.
+        Args:
+            slot: Index of the timer slot used in log_start_fast.
+            message: The log message.
+        """
+        end_time = _now()
+        if slot < 0 or self._slot_times is None:
+            raise IndexError(f"beacon slot {slot} out of range")
+        start_time = self._slot_times[slot] or None
+        self._slot_times[slot] = 0
+        self._log_beacon_end(slot, start_time, end_time, message, args, kwargs)
+
+
+class FastPrefixedLogger:
+    """
+    A minimal prefixed logger that writes lines straight to a stream, bypassing `logging`.
+
+    Lines have the same layout as the ones written by chronolog's handlers, but there are no
+    handlers, filters, propagation, `%`-style arguments or tracebacks. Intended only for hot
+    paths that do not need these features.
+    """
+
+    __slots__ = (
+        "level",
+        "flush_every",
+        "_prefix",
+        "_prefix_fmt",
+        "_binary",
+        "_write",
+        "_flush",
+        "_unflushed",
+        "_time_formatter",
+    )
+
+    def __init__(self, prefix=None, stream=None, level=logging.INFO, flush_every=64):
+        """
+        Args:
+            prefix: The string to prefix messages with.
+            stream: Text or binary stream to write to, e.g. sys.stderr.buffer. Defaults to the current
+                    sys.stderr. Lines are written to binary streams UTF-8 encoded.
+            level: Minimum level of messages to write.
+            flush_every: Number of written lines after which the stream is flushed.
+                         WARNING and above always flush immediately.
+        """
+        if stream is None:
+            stream = sys.stderr
+        self.level = level
+        self.flush_every = flush_every
+        self._binary = isinstance(stream, (io.RawIOBase, io.BufferedIOBase))
+        self._write = stream.write
+        self._flush = stream.flush
+        self._unflushed = 0
+        self._time_formatter = CachedTimeFormatter()
+        self.update_prefix(prefix)
+
+    def update_prefix(self, prefix):
+        """Update the prefix for log messages."""
+        self._prefix = prefix or "no-prefix"
+        self._prefix_fmt = f"[{self._prefix}] "
+
+    def _emit(self, levelname, message, flush):
+        now = time.time()
+        second = int(now)
+        asctime = self._time_formatter._render_second(second)
+        msecs = int((now - second) * 1000)
+        if self._binary:
+            self._write(
+                f"{asctime},{msecs:03d} - {levelname} - {self._prefix_fmt}{message}\n".encode()
             )
-            beacon_message = f"(BEACON - [{key}] - END (Elapsed time N/A s)) {message}"
         else:
-            elapsed_time = time.time() - start_time
-            beacon_message = f"(BEACON - [{key}] - END (Elapsed time {elapsed_time:.2f} s)) {message} "
-        self.info(beacon_message, *args, **kwargs)
+            self._write(
+                f"{asctime},{msecs:03d} - {levelname} - {self._prefix_fmt}{message}\n"
+            )
+        self._unflushed += 1
+        if flush or self._unflushed >= self.flush_every:
+            self.flush()
+
+    def flush(self):
+        """Flush the underlying stream."""
+        self._unflushed = 0
+        self._flush()
+
+    def debug(self, message):
+        """Write a debug message with prefix."""
+        if self.level <= _DEBUG:
+            self._emit("DEBUG", message, False)
+
+    def info(self, message):
+        """Write an info message with prefix."""
+        if self.level <= _INFO:
+            self._emit("INFO", message, False)
+
+    def warning(self, message):
+        """Write a warning message with prefix."""
+        if self.level <= _WARNING:
+            self._emit("WARNING", message, True)
+
+    def error(self, message):
+        """Write an error message with prefix."""
+        if self.level <= _ERROR:
+            self._emit("ERROR", message, True)
+
+    def critical(self, message):
+        """Write a critical message with prefix."""
+        if self.level <= _CRITICAL:
+            self._emit("CRITICAL", message, True)
 
 
 def setup_logging(
@@ -109,73 +517,123 @@ def setup_logging(
     log_file_path="logs.txt",
     log_file_max_bytes=100 * 1024 * 1024,  # 100MB by default
     log_file_backup_count=5,  # 5 backup files by default
+    queue_maxsize=None,
+    log_file_io_uring=False,
 ):
     """
     Set up logging configuration with both cloud and file handlers.
-    This function ensures handlers are added only once.
+    This function ensures handlers are added only once. They are added to the root logger,
+    alongside any handlers the application has configured itself.
+
+    The file and cloud handlers are run by a background listener thread fed through a queue,
+    so the logging call only pays for an enqueue. Console output stays synchronous.
 
     Args:
         logger_name: Name of the logger
         cloud_logger_name: Name for the cloud logging handler (used by Google Cloud Logging)
         enable_gcloud_logging: If True, attempts to set up Google Cloud Logging.
                                Set to False to avoid Google Cloud Logging initialization overhead.
-        log_file_path: Path to the log file for RotatingFileHandler.
+        log_file_path: Path to the log file for BatchedRotatingFileHandler.
         log_file_max_bytes: Maximum size of the log file before rotation (in bytes).
         log_file_backup_count: Number of backup log files to keep.
+        queue_maxsize: Maximum number of records waiting for the background listener.
+                       When the queue is full the oldest record is dropped. None means unbounded.
+        log_file_io_uring: If True, write the log file with UringRotatingFileHandler (Linux, needs `liburing`).
 
     Returns:
         Configured logger instance
     """
-    global _logging_configured
+    global _logging_configured, _queue_listener, _queue_handler, _stream_handler
+    global _google_cloud_client_failed
     if _logging_configured:
         # If already configured, just return the existing logger without re-adding handlers
-        return logging.getLogger(logger_name)
+        return _get_logger(logger_name)
+
+    # Remove the handlers of a previous configuration before replacing them
+    _stop_queue_listener()
+    if _stream_handler is not None:
+        logging.getLogger().removeHandler(_stream_handler)
 
-    handlers: list[logging.Handler] = [logging.StreamHandler()]
+    stream_handler = _stream_handler = logging.StreamHandler()
+    handlers: list[logging.Handler] = [stream_handler]
+    queued_handlers: list[logging.Handler] = []
 
-    # Conditionally initialize Google Cloud Logging client
+    # Conditionally import and initialize Google Cloud Logging client
     cloud_handler = None
-    if enable_gcloud_logging and _GOOGLE_CLOUD_LOGGING_AVAILABLE:
+    google_cloud_logging = (
+        _import_google_cloud_logging()
+        if enable_gcloud_logging and not _google_cloud_client_failed
+        else None
+    )
+    if google_cloud_logging is not None:
+        cloud_logging, CloudLoggingHandler = google_cloud_logging
         try:
-            client = google.cloud.logging.Client()
+            client = cloud_logging.Client()
             cloud_handler = CloudLoggingHandler(
                 client, name=cloud_logger_name or logger_name
             )
-            handlers.append(cloud_handler)
+            queued_handlers.append(cloud_handler)
         except Exception as e:
-            print(
-                f"Notice: Could not initialize Google Cloud Logging. Functionality disabled: {e}"
+            _google_cloud_client_failed = True
+            warnings.warn(
+                f"Could not initialize Google Cloud Logging. Functionality disabled: {e}",
+                RuntimeWarning,
+                stacklevel=2,
             )
-    elif enable_gcloud_logging and not _GOOGLE_CLOUD_LOGGING_AVAILABLE:
-        print(
-            "Warning: Google Cloud Logging requested but library is not available or failed to import."
-        )
 
     rotation_handler = None
     if log_file_path is not None:
         try:
-            rotation_handler = RotatingFileHandler(
+            file_handler_class = (
+                UringRotatingFileHandler
+                if log_file_io_uring
+                else BatchedRotatingFileHandler
+            )
+            rotation_handler = file_handler_class(
                 log_file_path,
                 maxBytes=log_file_max_bytes,
                 backupCount=log_file_backup_count,
             )
-            handlers.append(rotation_handler)
+            queued_handlers.append(rotation_handler)
         except Exception as e:
-            print("Info: RotatingFileHandler is not enabled.")
+            warnings.warn(
+                f"Could not open log file {log_file_path!r}, file logging is disabled: {e}",
+                RuntimeWarning,
+                stacklevel=2,
+            )
             rotation_handler = None  # Ensure it's None if creation failed
 
-    # Configure logging
-    logging.basicConfig(
-        level=logging.INFO,
-        format="%(asctime)s - %(levelname)s - %(message)s",
-        handlers=handlers,
-        force=True,  # We re-enable force=True here because _logging_configured prevents redundant setups.
-    )
+    # A single formatter shares its timestamp cache between the console and queued handlers
+    formatter = CachedTimeFormatter(_LOG_FORMAT)
+    for handler in (stream_handler, *queued_handlers):
+        handler.setFormatter(formatter)
+
+    if queued_handlers:
+        record_queue = _make_record_queue(queue_maxsize)
+        if queue_maxsize:
+            _queue_handler = _DropOldestQueueHandler(record_queue)
+        else:
+            _queue_handler = QueueHandler(record_queue)
+        # Records are queued with the message and traceback merged, formatted later by the listener's handlers
+        _queue_handler.setFormatter(logging.Formatter("%(message)s"))
+        handlers.append(_queue_handler)
+
+        _queue_listener = _QueueListener(
+            record_queue, *queued_handlers, respect_handler_level=True
+        )
+        _queue_listener.start()
+
+    # Configure the root logger. Handlers are added next to any the application already installed,
+    # _logging_configured prevents adding them twice.
+    root_logger = logging.getLogger()
+    root_logger.setLevel(_INFO)
+    for handler in handlers:
+        root_logger.addHandler(handler)
 
     # Set the flag to True after successful configuration
     _logging_configured = True
 
-    return logging.getLogger(logger_name)
+    return _get_logger(logger_name)
 
 
 def get_prefixed_logger(
@@ -186,30 +644,78 @@ def get_prefixed_logger(
     log_file_path="logs.txt",
     log_file_max_bytes=100 * 1024 * 1024,
     log_file_backup_count=5,
+    queue_maxsize=None,
+    log_file_io_uring=False,
 ):
     """
     Get a prefixed logger instance.
     The first call will set up the base logging configuration.
 
+    Every call returns a new PrefixedLogger, so update_prefix on it only affects the caller.
+    Once logging is configured setup is skipped, and the underlying logger and its bound methods
+    are cached per logger name, which keeps calling this per request cheap.
+
     Args:
         logger_name: Name of the logger
         prefix: The string to prefix messages with.
         cloud_logger_name: Name for the cloud logging handler (used by Google Cloud Logging)
         enable_gcloud_logging: If True, attempts to set up Google Cloud Logging.
                                Set to False to avoid Google Cloud Logging initialization overhead.
-        log_file_path: Path to the log file for RotatingFileHandler.
+        log_file_path: Path to the log file for BatchedRotatingFileHandler.
         log_file_max_bytes: Maximum size of the log file before rotation.
         log_file_backup_count: Number of backup log files to keep.
+        queue_maxsize: Maximum number of records waiting for the background listener, None means unbounded.
+        log_file_io_uring: If True, write the log file with io_uring (Linux, needs `liburing`).
 
     Returns:
         PrefixedLogger instance
     """
-    setup_logging(
-        logger_name,
-        cloud_logger_name,
-        enable_gcloud_logging=enable_gcloud_logging,
-        log_file_path=log_file_path,
-        log_file_max_bytes=log_file_max_bytes,
-        log_file_backup_count=log_file_backup_count,
-    )
+    if not _logging_configured:
+        setup_logging(
+            logger_name,
+            cloud_logger_name,
+            enable_gcloud_logging=enable_gcloud_logging,
+            log_file_path=log_file_path,
+            log_file_max_bytes=log_file_max_bytes,
+            log_file_backup_count=log_file_backup_count,
+            queue_maxsize=queue_maxsize,
+            log_file_io_uring=log_file_io_uring,
+        )
     return PrefixedLogger(logger_name, prefix)
+
+
+def prewarm_loggers(names):
+    """
+    Create and cache the loggers for the given names up front, e.g. at application startup.
+    Later PrefixedLogger and setup_logging lookups of these names are cache hits and do not
+    take the logging module lock.
+
+    Args:
+        names: Iterable of logger names.
+
+    Returns:
+        List of the logging.Logger instances, in the order of `names`
+    """
+    return [_logger_methods(name)[0] for name in names]
+
+
+def clear_prefixed_logger_cache():
+    """Drop the loggers and bound methods cached for PrefixedLogger construction."""
+    _logger_methods.cache_clear()
+
+
+def get_fast_prefixed_logger(prefix=None, stream=None, level=logging.INFO):
+    """
+    Get a FastPrefixedLogger writing directly to a stream.
+    It bypasses the `logging` module entirely: no configuration is set up and nothing is
+    sent to the file or Google Cloud handlers.
+
+    Args:
+        prefix: The string to prefix messages with.
+        stream: Text or binary stream to write to. Defaults to sys.stderr.
+        level: Minimum level of messages to write.
+
+    Returns:
+        FastPrefixedLogger instance
+    """
+    return FastPrefixedLogger(prefix, stream=stream, level=level)
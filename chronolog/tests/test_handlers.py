@@ -0,0 +1,351 @@
+import logging
+import os
+import shutil
+import tempfile
+import threading
+import unittest
+from unittest.mock import patch
+
+from chronolog.handlers import (
+    AsyncRotatingFileHandler,
+    BatchedRotatingFileHandler,
+    UringRotatingFileHandler,
+)
+
+try:
+    import liburing  # noqa: F401
+
+    _LIBURING_AVAILABLE = True
+except ImportError:
+    _LIBURING_AVAILABLE = False
+
+
+class _HandlerTestMixin:
+    """Temporary log file, handler factory and record helpers shared by the handler tests."""
+
+    handler_class = None
+    log_name = "handler.txt"
+    handler_defaults = {}
+
+    def setUp(self):
+        self.temp_log_dir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.temp_log_dir)
+        self.log_file = os.path.join(self.temp_log_dir, self.log_name)
+
+    def _make_handler(self, **kwargs):
+        handler = self.handler_class(
+            self.log_file, **{**self.handler_defaults, **kwargs}
+        )
+        self.addCleanup(handler.close)
+        return handler
+
+    def _read_log(self, suffix=""):
+        with open(self.log_file + suffix) as f:
+            return f.read()
+
+    @staticmethod
+    def _record(message):
+        return logging.makeLogRecord({"msg": message, "levelno": logging.INFO})
+
+
+class TestAsyncRotatingFileHandler(_HandlerTestMixin, unittest.TestCase):
+    handler_class = AsyncRotatingFileHandler
+    log_name = "async.txt"
+
+    def test_backups_are_shifted_in_order(self):
+        handler = self._make_handler(maxBytes=6, backupCount=2)
+
+        for message in ("one", "two", "three", "four"):
+            handler.handle(self._record(message))
+        handler.close()
+
+        self.assertEqual(self._read_log(), "four\n")
+        self.assertEqual(self._read_log(".1"), "three\n")
+        self.assertEqual(self._read_log(".2"), "two\n")
+        self.assertEqual(
+            sorted(os.listdir(self.temp_log_dir)),
+            ["async.txt", "async.txt.1", "async.txt.2"],
+        )
+
+    def test_rotator_runs_on_rotation_thread(self):
+        handler = self._make_handler(maxBytes=8, backupCount=1)
+        rotator_threads = []
+
+        def rotator(source, dest):
+            rotator_threads.append(threading.current_thread())
+            os.replace(source, dest)
+
+        handler.rotator = rotator
+        handler.handle(self._record("first"))
+        handler.handle(self._record("second"))
+
+        # The new file is usable before the rotation thread has run
+        self.assertEqual(self._read_log(), "second\n")
+        handler.close()
+
+        self.assertEqual(len(rotator_threads), 1)
+        self.assertIsNot(rotator_threads[0], threading.current_thread())
+        self.assertEqual(self._read_log(".1"), "first\n")
+
+    def test_rotated_file_name_includes_pid(self):
+        handler = self._make_handler(maxBytes=8, backupCount=1)
+        sources = []
+
+        def rotator(source, dest):
+            sources.append(os.path.basename(source))
+            os.replace(source, dest)
+
+        handler.rotator = rotator
+        handler.handle(self._record("first"))
+        handler.handle(self._record("second"))
+        handler.close()
+
+        self.assertEqual(sources, [f"async.txt.rotating.{os.getpid()}.0"])
+
+    def test_leftover_rotated_files_are_shifted_into_backups(self):
+        # Moved aside by processes that exited before their rotation thread ran
+        for name, contents, mtime in (
+            ("async.txt.rotating.0", "oldest\n", 1_000),
+            ("async.txt.rotating.4242.0", "newest\n", 2_000),
+        ):
+            path = os.path.join(self.temp_log_dir, name)
+            with open(path, "w") as f:
+                f.write(contents)
+            os.utime(path, (mtime, mtime))
+
+        handler = self._make_handler(maxBytes=1024, backupCount=2)
+        handler.close()
+
+        self.assertEqual(self._read_log(".1"), "newest\n")
+        self.assertEqual(self._read_log(".2"), "oldest\n")
+        self.assertEqual(
+            sorted(os.listdir(self.temp_log_dir)),
+            ["async.txt", "async.txt.1", "async.txt.2"],
+        )
+
+    def test_existing_backup_is_removed_before_rotate(self):
+        handler = self._make_handler(maxBytes=8, backupCount=1)
+        overwritten = []
+
+        def rotator(source, dest):
+            # Like os.rename on Windows, which refuses to replace an existing file
+            overwritten.append(os.path.exists(dest))
+            os.replace(source, dest)
+
+        handler.rotator = rotator
+        for message in ("first", "second", "third"):
+            handler.handle(self._record(message))
+        handler.close()
+
+        self.assertEqual(overwritten, [False, False])
+        self.assertEqual(self._read_log(".1"), "second\n")
+
+    def test_failed_rotation_is_reported_and_retried(self):
+        handler = self._make_handler(maxBytes=8, backupCount=2)
+        calls = []
+
+        def rotator(source, dest):
+            calls.append(os.path.basename(source))
+            if len(calls) == 1:
+                raise OSError("disk full")
+            os.replace(source, dest)
+
+        handler.rotator = rotator
+        with self.assertWarnsRegex(
+            RuntimeWarning, r"async\.txt\.rotating\.\d+\.0'.*disk full"
+        ):
+            handler.handle(self._record("first"))
+            handler.handle(self._record("second"))
+            # The failed file is retried before the next one is shifted
+            handler.handle(self._record("third"))
+            handler.close()
+
+        pid = os.getpid()
+        self.assertEqual(
+            calls,
+            [
+                f"async.txt.rotating.{pid}.0",
+                f"async.txt.rotating.{pid}.0",
+                f"async.txt.rotating.{pid}.1",
+            ],
+        )
+        self.assertEqual(self._read_log(".1"), "second\n")
+        self.assertEqual(self._read_log(".2"), "first\n")
+        self.assertEqual(
+            sorted(os.listdir(self.temp_log_dir)),
+            ["async.txt", "async.txt.1", "async.txt.2"],
+        )
+
+    def test_failed_rotation_is_left_for_the_next_handler(self):
+        handler = self._make_handler(maxBytes=8, backupCount=1)
+
+        def rotator(source, dest):
+            raise OSError("disk full")
+
+        handler.rotator = rotator
+        with self.assertWarns(RuntimeWarning):
+            handler.handle(self._record("first"))
+            handler.handle(self._record("second"))
+            handler.close()
+        self.assertIn(
+            f"async.txt.rotating.{os.getpid()}.0", os.listdir(self.temp_log_dir)
+        )
+
+        # Picked up by the leftover scan of the next handler on this file
+        self._make_handler(maxBytes=8, backupCount=1).close()
+        self.assertEqual(self._read_log(".1"), "first\n")
+
+    def test_no_backups_rotates_inline(self):
+        handler = self._make_handler(maxBytes=8, backupCount=0)
+
+        handler.handle(self._record("first"))
+        handler.handle(self._record("second"))
+
+        self.assertIsNone(handler._rotation_thread)
+        self.assertEqual(os.listdir(self.temp_log_dir), ["async.txt"])
+
+
+class TestBatchedRotatingFileHandler(_HandlerTestMixin, unittest.TestCase):
+    handler_class = BatchedRotatingFileHandler
+    log_name = "batched.txt"
+    # Flush explicitly unless a test wants the thread
+    handler_defaults = {"flush_interval": None}
+
+    def test_records_are_buffered_until_capacity(self):
+        handler = self._make_handler(capacity=3)
+
+        handler.handle(self._record("one"))
+        handler.handle(self._record("two"))
+        self.assertEqual(
+            self._read_log(), "", "Records below capacity should stay buffered"
+        )
+
+        handler.handle(self._record("three"))
+        self.assertEqual(self._read_log(), "one\ntwo\nthree\n")
+
+    def test_flush_and_close_write_partial_batch(self):
+        handler = self._make_handler(capacity=10)
+
+        handler.handle(self._record("flushed"))
+        handler.flush()
+        self.assertEqual(self._read_log(), "flushed\n")
+
+        handler.handle(self._record("closed"))
+        handler.close()
+        self.assertEqual(self._read_log(), "flushed\nclosed\n")
+
+    def test_background_thread_flushes_partial_batch(self):
+        handler = self._make_handler(capacity=10, flush_interval=0.01)
+
+        handler.handle(self._record("eventually written"))
+        # Wait for the flush thread instead of closing, close() would write the buffer itself
+        for _ in range(100):
+            if not handler._buffer:
+                break
+            handler._closing.wait(0.01)
+        self.assertEqual(handler._buffer, [])
+        self.assertEqual(self._read_log(), "eventually written\n")
+
+    def test_batch_rolls_over_before_exceeding_max_bytes(self):
+        handler = self._make_handler(capacity=2, maxBytes=20, backupCount=2)
+
+        handler.handle(self._record("aaaaaaaa"))
+        handler.handle(self._record("bbbbbbbb"))  # 18 bytes, fits in the first file
+        handler.handle(self._record("cccccccc"))
+        handler.handle(self._record("dddddddd"))  # Would reach 36 bytes, rotates first
+        handler.close()  # Waits for the rotation thread to put the backup in place
+
+        self.assertEqual(self._read_log(".1"), "aaaaaaaa\nbbbbbbbb\n")
+        self.assertEqual(self._read_log(), "cccccccc\ndddddddd\n")
+
+    @unittest.skipUnless(hasattr(os, "mkfifo"), "os.mkfifo is not available")
+    def test_fifo_is_written_without_rollover(self):
+        fifo = os.path.join(self.temp_log_dir, "fifo")
+        os.mkfifo(fifo)
+        reader = os.open(fifo, os.O_RDONLY | os.O_NONBLOCK)
+        self.addCleanup(os.close, reader)
+        self.log_file = fifo
+        handler = self._make_handler(capacity=1, maxBytes=8, backupCount=1)
+
+        handler.handle(self._record("through the pipe"))
+        handler.handle(self._record("still the pipe"))
+        handler.close()
+
+        self.assertEqual(os.read(reader, 1024), b"through the pipe\nstill the pipe\n")
+        self.assertEqual(sorted(os.listdir(self.temp_log_dir)), ["fifo"])
+
+
+@unittest.skipUnless(_LIBURING_AVAILABLE, "liburing is not installed")
+class TestUringRotatingFileHandler(_HandlerTestMixin, unittest.TestCase):
+    handler_class = UringRotatingFileHandler
+    log_name = "uring.txt"
+    handler_defaults = {"flush_interval": None}
+
+    def _make_handler(self, **kwargs):
+        handler = super()._make_handler(**kwargs)
+        if handler._ring is None:
+            self.skipTest("The kernel does not allow creating an io_uring ring")
+        return handler
+
+    def test_batches_are_written_through_the_ring(self):
+        handler = self._make_handler(capacity=2)
+
+        for message in ("one", "two", "three"):
+            handler.handle(self._record(message))
+        handler.flush()
+        # The last batch is in flight until the next write, rotation or close
+        handler._wait_for_write()
+        self.assertEqual(self._read_log(), "one\ntwo\nthree\n")
+
+        handler.handle(self._record("four"))
+        handler.close()
+        self.assertEqual(self._read_log(), "one\ntwo\nthree\nfour\n")
+
+    def test_sqpoll_ring_writes_batches(self):
+        handler = self._make_handler(capacity=2, sqpoll=True)
+
+        for message in ("polled", "by the kernel"):
+            handler.handle(self._record(message))
+        handler.close()
+        self.assertEqual(self._read_log(), "polled\nby the kernel\n")
+
+    def test_rotation_waits_for_write_in_flight(self):
+        handler = self._make_handler(capacity=2, maxBytes=20, backupCount=2)
+
+        for message in ("aaaaaaaa", "bbbbbbbb", "cccccccc", "dddddddd"):
+            handler.handle(self._record(message))
+        handler.close()
+
+        self.assertEqual(self._read_log(".1"), "aaaaaaaa\nbbbbbbbb\n")
+        self.assertEqual(self._read_log(), "cccccccc\ndddddddd\n")
+
+    def test_write_mode_appends_batches(self):
+        # maxBytes=0 keeps mode="w", the file is not opened with O_APPEND
+        handler = self._make_handler(capacity=1, mode="w")
+
+        for message in ("one", "two", "three"):
+            handler.handle(self._record(message))
+        handler.close()
+        self.assertEqual(self._read_log(), "one\ntwo\nthree\n")
+
+    def test_ring_is_not_created_if_file_cannot_be_opened(self):
+        missing_dir_file = os.path.join(self.temp_log_dir, "missing", "uring.txt")
+
+        with patch.object(UringRotatingFileHandler, "_open_ring") as open_ring:
+            with self.assertRaises(OSError):
+                UringRotatingFileHandler(missing_dir_file, flush_interval=None)
+        open_ring.assert_not_called()
+
+    def test_falls_back_to_stream_writes_without_ring(self):
+        with patch.object(UringRotatingFileHandler, "_open_ring"):
+            handler = UringRotatingFileHandler(self.log_file, flush_interval=None)
+        self.addCleanup(handler.close)
+        self.assertIsNone(handler._ring)
+
+        handler.handle(self._record("plain write"))
+        handler.flush()
+        self.assertEqual(self._read_log(), "plain write\n")
+
+
+if __name__ == "__main__":
+    unittest.main()
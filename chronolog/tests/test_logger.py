@@ -3,13 +3,14 @@ import logging
 import os
 import tempfile
 import shutil
+import time
 from unittest.mock import patch, MagicMock
 
 # Import the module under test
 # Assuming the test is run from the project root or chronolog directory,
 # ensuring chronolog/chronolog is discoverable on sys.path.
 from chronolog import logger
-from logging.handlers import RotatingFileHandler
+from logging.handlers import QueueHandler, RotatingFileHandler
 
 
 class TestLogger(unittest.TestCase):
@@ -20,6 +21,9 @@ class TestLogger(unittest.TestCase):
         # Reset the module-level flag before each test
         # This ensures setup_logging can be called fully for each test's fresh state.
         logger._logging_configured = False
+        logger._stop_queue_listener()
+        # Cached PrefixedLoggers would skip the patched setup_logging in get_prefixed_logger tests
+        logger.clear_prefixed_logger_cache()
 
         # Get all loggers and remove their handlers to ensure a clean slate.
         # This is critical to prevent handlers from accumulating across tests
@@ -49,11 +53,11 @@ class TestLogger(unittest.TestCase):
         root_logger.setLevel(logging.WARNING)  # A common default level
 
     def tearDown(self):
-        # Clean up the temporary directory after each test
-        shutil.rmtree(self.temp_log_dir)
-
         # Reset the module-level flag again (good practice for idempotency)
         logger._logging_configured = False
+        # Stop the background listener so it releases the log files before they are removed
+        logger._stop_queue_listener()
+        logger.clear_prefixed_logger_cache()
 
         # Clean up handlers again, just to be safe, echoing setUp's cleanup
         for log_name in logging.Logger.manager.loggerDict:
@@ -72,14 +76,18 @@ class TestLogger(unittest.TestCase):
             chronolog_logger.removeHandler(h)
             h.close()
 
+        # Clean up the temporary directory after each test
+        shutil.rmtree(self.temp_log_dir)
+
     def _get_file_handler(self, logger_instance=None):
-        """Helper to find RotatingFileHandler from the root logger's handlers.
-        `setup_logging` uses `logging.basicConfig` which configures the root logger.
+        """Helper to find RotatingFileHandler from the background queue listener's handlers.
+        `setup_logging` installs a QueueHandler on the root logger and runs the file handler
+        in a `QueueListener`.
         """
-        # Always check the root logger for handlers added by basicConfig
-        target_logger = logging.getLogger()
+        if logger._queue_listener is None:
+            return None
 
-        for handler in target_logger.handlers:
+        for handler in logger._queue_listener.handlers:
             if isinstance(handler, RotatingFileHandler):
                 return handler
         return None
@@ -186,6 +194,8 @@ class TestLogger(unittest.TestCase):
             log_file_path=log_file_path,
             log_file_max_bytes=log_file_max_bytes,
             log_file_backup_count=log_file_backup_count,
+            queue_maxsize=None,
+            log_file_io_uring=False,
         )
 
         # Also check the returned PrefixedLogger instance
@@ -215,6 +225,8 @@ class TestLogger(unittest.TestCase):
             * 1024
             * 1024,  # Default value for max_bytes if not provided
             log_file_backup_count=5,  # Default value for backup_count if not provided
+            queue_maxsize=None,  # Default unbounded queue
+            log_file_io_uring=False,  # Default buffered file writes
         )
 
         # Also check the returned PrefixedLogger instance
@@ -222,6 +234,40 @@ class TestLogger(unittest.TestCase):
         self.assertEqual(prefixed_logger_instance._prefix, prefix)
         self.assertEqual(prefixed_logger_instance.logger.name, logger_name)
 
+    @patch("chronolog.logger.setup_logging")
+    def test_get_prefixed_logger_skips_setup_once_configured(self, mock_setup_logging):
+        first = logger.get_prefixed_logger(
+            "cached_app", prefix="CACHED", log_file_path=None
+        )
+        self.assertEqual(mock_setup_logging.call_count, 1)
+
+        logger._logging_configured = True  # What the real setup_logging leaves behind
+        second = logger.get_prefixed_logger(
+            "cached_app", prefix="OTHER", log_file_path=None
+        )
+        self.assertEqual(mock_setup_logging.call_count, 1)
+
+        # New instances around the same cached logger and bound methods
+        self.assertIsNot(first, second)
+        self.assertIs(first.logger, second.logger)
+        self.assertIs(first._info, second._info)
+
+        logger.clear_prefixed_logger_cache()
+        third = logger.get_prefixed_logger(
+            "cached_app", prefix="CACHED", log_file_path=None
+        )
+        self.assertIs(third.logger, first.logger)
+        self.assertIsNot(third._info, first._info)
+
+    @patch("chronolog.logger.setup_logging")
+    def test_get_prefixed_logger_update_prefix_is_not_shared(self, mock_setup_logging):
+        logger.get_prefixed_logger(
+            "my_app", prefix="APP", log_file_path=None
+        ).update_prefix("PROCESS_A")
+
+        again = logger.get_prefixed_logger("my_app", prefix="APP", log_file_path=None)
+        self.assertEqual(again._prefix, "APP")
+
     def test_setup_logging_prevents_reconfiguration(self):
         # This test verifies that the _logging_configured flag works as intended,
         # preventing setup_logging from re-configuring if it's already been run.
@@ -278,6 +324,277 @@ class TestLogger(unittest.TestCase):
             "File handler path should remain from the first configuration",
         )
 
+    def test_setup_logging_writes_file_through_queue(self):
+        log_file = os.path.join(self.temp_log_dir, "queued.txt")
+
+        configured_logger = logger.setup_logging(
+            logger_name="test_queue_logger",
+            log_file_path=log_file,
+            enable_gcloud_logging=False,
+        )
+
+        # Only the console and queue handlers are attached to the root logger
+        root_handlers = logging.getLogger().handlers
+        self.assertEqual(len(root_handlers), 2)
+        self.assertTrue(any(isinstance(h, QueueHandler) for h in root_handlers))
+        self.assertFalse(any(isinstance(h, RotatingFileHandler) for h in root_handlers))
+
+        configured_logger.info("Written by the listener thread.")
+
+        # Stopping the listener drains the queue into the file handler
+        logger._stop_queue_listener()
+        self.assertIsNone(logger._queue_listener)
+        with open(log_file) as f:
+            contents = f.read()
+        self.assertIn(" - INFO - Written by the listener thread.", contents)
+        self.assertEqual(contents.count("\n"), 1)
+
+    def test_queue_listener_writes_batch_when_queue_drained(self):
+        log_file = os.path.join(self.temp_log_dir, "drained.txt")
+
+        configured_logger = logger.setup_logging(
+            logger_name="test_drained_logger",
+            log_file_path=log_file,
+            enable_gcloud_logging=False,
+        )
+        file_handler = self._get_file_handler()
+        file_handler._closing.set()  # Stop the periodic flush, only the listener may write the batch
+
+        configured_logger.info("Written once the queue is empty.")
+
+        # The listener flushes without being stopped, as soon as it has nothing left to handle
+        for _ in range(100):
+            if os.path.getsize(log_file):
+                break
+            time.sleep(0.01)
+        with open(log_file) as f:
+            self.assertIn("Written once the queue is empty.", f.read())
+
+    def test_setup_logging_selects_io_uring_file_handler(self):
+        logger.setup_logging(
+            logger_name="test_uring_logger",
+            log_file_path=os.path.join(self.temp_log_dir, "uring.txt"),
+            log_file_io_uring=True,
+            enable_gcloud_logging=False,
+        )
+
+        self.assertIsInstance(self._get_file_handler(), logger.UringRotatingFileHandler)
+
+    def test_setup_logging_without_queued_handlers(self):
+        logger.setup_logging(
+            logger_name="test_console_only_logger",
+            log_file_path=None,
+            enable_gcloud_logging=False,
+        )
+
+        # Nothing to run in the background, so no listener thread is started
+        self.assertIsNone(logger._queue_listener)
+        self.assertFalse(
+            any(isinstance(h, QueueHandler) for h in logging.getLogger().handlers)
+        )
+
+    def test_setup_logging_keeps_existing_root_handlers(self):
+        app_handler = logging.NullHandler()
+        logging.getLogger().addHandler(app_handler)
+
+        logger.setup_logging(
+            logger_name="test_composed_logger",
+            log_file_path=None,
+            enable_gcloud_logging=False,
+        )
+
+        root_logger = logging.getLogger()
+        self.assertIn(app_handler, root_logger.handlers)
+        self.assertEqual(len(root_logger.handlers), 2)
+        self.assertEqual(root_logger.level, logging.INFO)
+
+    def test_reconfiguration_replaces_console_handler(self):
+        for _ in range(2):
+            logger._logging_configured = False
+            logger.setup_logging(
+                logger_name="test_reconfigured_logger",
+                log_file_path=None,
+                enable_gcloud_logging=False,
+            )
+
+        stream_handlers = [
+            h for h in logging.getLogger().handlers if type(h) is logging.StreamHandler
+        ]
+        self.assertEqual(stream_handlers, [logger._stream_handler])
+
+    def test_setup_logging_returns_standard_logger_when_configured(self):
+        logger.setup_logging(
+            logger_name="first_logger", log_file_path=None, enable_gcloud_logging=False
+        )
+
+        # The already-configured path returns the same objects as logging.getLogger
+        for name in ("first_logger", "other_logger", "other_logger"):
+            self.assertIs(
+                logger.setup_logging(logger_name=name, log_file_path=None),
+                logging.getLogger(name),
+            )
+
+    @patch("chronolog.logger._import_google_cloud_logging")
+    def test_setup_logging_skips_gcloud_import_when_disabled(self, mock_import):
+        logger.setup_logging(
+            logger_name="test_local_only_logger",
+            log_file_path=None,
+            enable_gcloud_logging=False,
+        )
+
+        mock_import.assert_not_called()
+
+    @patch("chronolog.logger._import_google_cloud_logging")
+    def test_setup_logging_queues_gcloud_handler(self, mock_import):
+        class FakeCloudLoggingHandler(logging.Handler):
+            def __init__(self, client, name=None):
+                super().__init__()
+                self.client = client
+                self.cloud_logger_name = name
+
+            def emit(self, record):
+                pass
+
+        cloud_logging = MagicMock()
+        mock_import.return_value = (cloud_logging, FakeCloudLoggingHandler)
+
+        logger.setup_logging(
+            logger_name="test_cloud_logger",
+            cloud_logger_name="my-cloud-logger",
+            log_file_path=None,
+            enable_gcloud_logging=True,
+        )
+
+        mock_import.assert_called_once_with()
+        cloud_logging.Client.assert_called_once_with()
+        self.assertIsNotNone(logger._queue_listener)
+        (cloud_handler,) = logger._queue_listener.handlers
+        self.assertIsInstance(cloud_handler, FakeCloudLoggingHandler)
+        self.assertIs(cloud_handler.client, cloud_logging.Client.return_value)
+        self.assertEqual(cloud_handler.cloud_logger_name, "my-cloud-logger")
+
+    def test_cached_time_formatter_matches_standard_formatter(self):
+        fmt = "%(asctime)s - %(levelname)s - %(message)s"
+        cached_formatter = logger.CachedTimeFormatter(fmt)
+        standard_formatter = logging.Formatter(fmt)
+
+        # Records within the same second, then in the following seconds
+        for created in (1700000000.001, 1700000000.999, 1700000001.5, 1700000123.042):
+            record = logging.makeLogRecord({"msg": "tick", "levelname": "INFO"})
+            record.created = created
+            record.msecs = (created - int(created)) * 1000
+            self.assertEqual(
+                cached_formatter.format(record), standard_formatter.format(record)
+            )
+
+        # An explicit date format is rendered without the cache
+        dated_formatter = logger.CachedTimeFormatter("%(asctime)s", datefmt="%H:%M")
+        self.assertEqual(
+            dated_formatter.format(record),
+            logging.Formatter("%(asctime)s", datefmt="%H:%M").format(record),
+        )
+
+    def test_setup_logging_uses_cached_time_formatter(self):
+        logger.setup_logging(
+            logger_name="test_formatter_logger",
+            log_file_path=os.path.join(self.temp_log_dir, "formatted.txt"),
+            enable_gcloud_logging=False,
+        )
+
+        stream_handler = next(
+            h for h in logging.getLogger().handlers if not isinstance(h, QueueHandler)
+        )
+        self.assertIsInstance(stream_handler.formatter, logger.CachedTimeFormatter)
+        self.assertIsInstance(
+            self._get_file_handler().formatter, logger.CachedTimeFormatter
+        )
+
+    @patch("chronolog.logger._google_cloud_client_failed", False)
+    @patch("chronolog.logger._import_google_cloud_logging")
+    def test_setup_logging_does_not_retry_failed_gcloud_client(self, mock_import):
+        cloud_logging = MagicMock()
+        cloud_logging.Client.side_effect = RuntimeError("no credentials")
+        mock_import.return_value = (cloud_logging, MagicMock())
+
+        with self.assertWarnsRegex(RuntimeWarning, "no credentials"):
+            logger.setup_logging(
+                logger_name="test_failing_cloud_logger",
+                log_file_path=None,
+                enable_gcloud_logging=True,
+            )
+        self.assertIsNone(logger._queue_listener)
+
+        # A later configuration does not construct another client
+        logger._logging_configured = False
+        logger.setup_logging(
+            logger_name="test_failing_cloud_logger",
+            log_file_path=None,
+            enable_gcloud_logging=True,
+        )
+        cloud_logging.Client.assert_called_once_with()
+
+    def test_setup_logging_warns_when_log_file_cannot_be_opened(self):
+        missing_dir_file = os.path.join(self.temp_log_dir, "missing", "logs.txt")
+
+        with self.assertWarnsRegex(RuntimeWarning, "file logging is disabled"):
+            logger.setup_logging(
+                logger_name="test_bad_file_logger",
+                log_file_path=missing_dir_file,
+                enable_gcloud_logging=False,
+            )
+        self.assertIsNone(self._get_file_handler())
+
+    def test_bounded_queue_drops_oldest_record(self):
+        handler = logger._DropOldestQueueHandler(logger.queue.Queue(maxsize=2))
+
+        for message in ("first", "second", "third"):
+            handler.handle(logging.makeLogRecord({"msg": message}))
+
+        queued = [handler.queue.get_nowait().msg for _ in range(2)]
+        self.assertEqual(queued, ["second", "third"])
+
+    @unittest.skipUnless(hasattr(os, "fork"), "os.fork is not available")
+    def test_forked_child_writes_through_its_own_listener(self):
+        log_file = os.path.join(self.temp_log_dir, "forked.txt")
+        configured_logger = logger.setup_logging(
+            logger_name="test_forked_logger",
+            log_file_path=log_file,
+            enable_gcloud_logging=False,
+        )
+        parent_listener = logger._queue_listener
+        # Buffered in the parent at fork time, only the parent may write it
+        self._get_file_handler().handle(
+            logging.makeLogRecord(
+                {"msg": "Buffered by the parent.", "levelno": logging.INFO}
+            )
+        )
+
+        pid = os.fork()
+        if pid == 0:
+            # Leave with os._exit like multiprocessing workers do, skipping atexit
+            exit_code = 1
+            try:
+                if logger._queue_listener is not parent_listener:
+                    for i in range(3):
+                        configured_logger.info("Logged by the child %d.", i)
+                    for _ in range(200):
+                        with open(log_file) as f:
+                            if f.read().count("Logged by the child") == 3:
+                                exit_code = 0
+                                break
+                        time.sleep(0.01)
+            finally:
+                os._exit(exit_code)
+
+        _, status = os.waitpid(pid, 0)
+        self.assertEqual(os.waitstatus_to_exitcode(status), 0)
+
+        logger._stop_queue_listener()
+        with open(log_file) as f:
+            contents = f.read()
+        self.assertEqual(contents.count("Buffered by the parent."), 1)
+        self.assertEqual(contents.count("Logged by the child"), 3)
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -1,9 +1,16 @@
 import pytest
+import io
 import logging
-import time
+import re
+import threading
 
 
-from chronolog import PrefixedLogger
+from chronolog import (
+    FastPrefixedLogger,
+    PrefixedLogger,
+    get_fast_prefixed_logger,
+    prewarm_loggers,
+)
 
 
 # Helper to get a logger instance for testing
@@ -55,14 +62,15 @@ def test_update_prefix(caplog):
 
 def test_beacon_timer_logging(caplog, monkeypatch):
     """Test the log_start and log_end beacon functionality with timing."""
-    start_time = 1000.0
-    end_time = 1002.5
+    start_time = 1_000_000_000_000
+    end_time = 1_002_500_000_000
 
-    # Mock time.time() to return predictable values
-    # Add extra values in case time.time() is called more than expected
+    # Mock the beacon clock (time.monotonic_ns) to return predictable nanosecond values
+    # Add extra values in case the clock is called more than expected
     time_calls = [start_time, end_time, end_time, end_time]
     monkeypatch.setattr(
-        time, "time", lambda: time_calls.pop(0) if time_calls else end_time
+        "chronolog.logger._now",
+        lambda: time_calls.pop(0) if time_calls else end_time,
     )
 
     with caplog.at_level(logging.INFO):
@@ -112,3 +120,218 @@ def test_beacon_log_end_without_start(caplog):
     assert (
         "(BEACON - [dangling-task] - END (Elapsed time N/A s))" in info_record.message
     )
+
+
+def test_disabled_level_skips_formatting(caplog):
+    """Test that messages below the logger level are not formatted at all."""
+    rendered = []
+
+    class Message:
+        def __init__(self, text):
+            self.text = text
+
+        def __str__(self):
+            rendered.append(self.text)
+            return self.text
+
+    logger = PrefixedLogger(logger_name="disabled_level_test", prefix="quiet")
+    logger.logger.setLevel(logging.WARNING)
+
+    with caplog.at_level(logging.WARNING, logger="disabled_level_test"):
+        logger.debug(Message("Hidden debug."))
+        logger.info(Message("Hidden info."))
+        logger.warning(Message("Visible warning."))
+
+    assert rendered == ["Visible warning."]
+    assert [r.message for r in caplog.records] == ["[quiet] Visible warning."]
+
+
+def test_non_string_message_prefixing(caplog):
+    """Test that non-string messages, e.g. exceptions, are prefixed like strings."""
+    with caplog.at_level(logging.INFO):
+        logger = get_test_logger("obj-prefix", caplog)
+        logger.error(ValueError("bad value"))
+
+    assert caplog.records[0].message == "[obj-prefix] bad value"
+
+
+def test_beacon_disabled_level_keeps_timer(caplog, monkeypatch):
+    """Test that suppressed beacons log nothing but still time the operation."""
+    time_calls = [1_000_000_000_000, 1_001_000_000_000]
+    monkeypatch.setattr("chronolog.logger._now", lambda: time_calls.pop(0))
+
+    with caplog.at_level(logging.INFO):
+        logger = PrefixedLogger(logger_name="beacon_disabled_test", prefix="quiet")
+        logger.logger.setLevel(logging.WARNING)
+        logger.log_start("quiet-task", "Not logged.")
+        assert "quiet-task" in logger._start_times.timers
+
+        logger.logger.setLevel(logging.INFO)
+        logger.log_end("quiet-task", "Logged.")
+
+    assert len(caplog.records) == 1
+    assert "(BEACON - [quiet-task] - END (Elapsed time 1.00 s)) Logged." in (
+        caplog.records[0].message
+    )
+
+
+def test_logger_has_no_instance_dict():
+    """Test that PrefixedLogger instances use slots instead of a per-instance dict."""
+    logger = PrefixedLogger(logger_name="slots_test", prefix="slots")
+    assert not hasattr(logger, "__dict__")
+
+
+def test_beacon_timers_are_created_on_first_log_start():
+    """Test that the per-thread beacon timers are only created when a beacon is started."""
+    logger = PrefixedLogger(logger_name="lazy_timers_test", prefix="lazy")
+    assert logger._start_times is None
+
+    logger.log_end("never-started", "Ended without a start.")
+    assert logger._start_times is None
+
+    logger.log_start("started", "Started.")
+    assert "started" in logger._start_times.timers
+
+
+def test_fast_beacon_timer_logging(caplog, monkeypatch):
+    """Test the log_start_fast and log_end_fast slot based beacons."""
+    time_calls = [1_000_000_000_000, 1_000_250_000_000, 1_000_300_000_000]
+    monkeypatch.setattr("chronolog.logger._now", lambda: time_calls.pop(0))
+
+    with caplog.at_level(logging.INFO):
+        logger = PrefixedLogger(
+            logger_name="fast_beacon_test", prefix="fast", beacon_slots=4
+        )
+        logger.log_start_fast(2, "Starting slot task.")
+        logger.log_end_fast(2, "Finished slot task.")
+        # The slot is released by log_end_fast
+        logger.log_end_fast(2, "Finished again.")
+
+    messages = [r.message for r in caplog.records]
+    assert messages[0] == "[fast] (BEACON - [2] - START) Starting slot task."
+    assert (
+        messages[1]
+        == "[fast] (BEACON - [2] - END (Elapsed time 0.25 s)) Finished slot task. "
+    )
+    assert caplog.records[2].levelname == "WARNING"
+    assert "(BEACON - [2] - END (Elapsed time N/A s))" in messages[3]
+
+
+def test_fast_beacon_rejects_slots_out_of_range():
+    """Test that slots outside of beacon_slots, including negative ones, are rejected."""
+    logger = PrefixedLogger(
+        logger_name="fast_range_test", prefix="fast", beacon_slots=2
+    )
+    for slot in (-1, 2):
+        with pytest.raises(IndexError):
+            logger.log_start_fast(slot, "Out of range.")
+        with pytest.raises(IndexError):
+            logger.log_end_fast(slot, "Out of range.")
+
+    without_slots = PrefixedLogger(logger_name="fast_range_test", prefix="none")
+    assert without_slots._slot_times is None
+    with pytest.raises(IndexError):
+        without_slots.log_start_fast(0, "No slots.")
+
+
+def test_beacon_timers_are_per_thread(caplog):
+    """Test that a beacon started in one thread is not visible to another thread."""
+    with caplog.at_level(logging.INFO):
+        logger = get_test_logger("thread-test", caplog)
+        logger.log_start("shared-key", "Started in the main thread.")
+
+        worker = threading.Thread(
+            target=logger.log_end, args=("shared-key", "Ended in a worker thread.")
+        )
+        worker.start()
+        worker.join()
+
+        logger.log_end("shared-key", "Ended in the main thread.")
+
+    messages = [r.message for r in caplog.records]
+    assert "log_end called for key 'shared-key' without a corresponding log_start." in (
+        messages[1]
+    )
+    assert "(Elapsed time N/A s)) Ended in a worker thread." in messages[2]
+    assert "(Elapsed time N/A s)" not in messages[3]
+
+
+def test_fast_logger_writes_prefixed_lines():
+    """Test that the fast logger writes chronolog formatted lines to its stream."""
+    stream = io.StringIO()
+    logger = get_fast_prefixed_logger("fast", stream=stream)
+
+    logger.info("Fast message.")
+    logger.update_prefix("faster")
+    logger.error(ValueError("Fast error."))
+
+    lines = stream.getvalue().splitlines()
+    assert len(lines) == 2
+    assert re.fullmatch(
+        r"\d{4}-\d\d-\d\d \d\d:\d\d:\d\d,\d{3} - INFO - \[fast\] Fast message\.",
+        lines[0],
+    )
+    assert lines[1].endswith(" - ERROR - [faster] Fast error.")
+
+
+def test_fast_logger_level_and_flushing():
+    """Test that the fast logger filters by level and flushes periodically."""
+
+    class CountingStream(io.StringIO):
+        flushes = 0
+
+        def flush(self):
+            self.flushes += 1
+            super().flush()
+
+    stream = CountingStream()
+    logger = FastPrefixedLogger("fast", stream=stream, flush_every=2)
+
+    logger.debug("Below the default INFO level.")
+    assert stream.getvalue() == ""
+
+    logger.info("One.")
+    assert stream.flushes == 0
+    logger.info("Two.")
+    assert stream.flushes == 1
+    logger.warning("Warnings flush immediately.")
+    assert stream.flushes == 2
+
+    logger.level = logging.DEBUG
+    logger.debug("Now visible.")
+    assert stream.getvalue().splitlines()[-1].endswith(" - DEBUG - [fast] Now visible.")
+
+
+def test_args_and_kwargs_are_forwarded(caplog):
+    """Test that %-style arguments and logging kwargs reach the underlying logger."""
+    with caplog.at_level(logging.INFO):
+        logger = get_test_logger("forward", caplog)
+        logger.info("Processed %d of %s.", 3, "items", extra={"job": "import"})
+        logger.info("100% literal")
+
+    assert caplog.records[0].message == "[forward] Processed 3 of items."
+    assert caplog.records[0].job == "import"
+    assert caplog.records[1].message == "[forward] 100% literal"
+
+
+def test_prewarm_loggers_returns_shared_loggers():
+    """Test that prewarmed loggers are the ones PrefixedLogger later wraps."""
+    warmed = prewarm_loggers(["warm.api", "warm.db"])
+
+    assert [l.name for l in warmed] == ["warm.api", "warm.db"]
+    assert warmed[0] is logging.getLogger("warm.api")
+    assert PrefixedLogger(logger_name="warm.db").logger is warmed[1]
+
+
+def test_fast_logger_writes_binary_streams():
+    """Test that the fast logger writes UTF-8 encoded lines to binary streams."""
+    stream = io.BytesIO()
+    logger = FastPrefixedLogger("bytes", stream=stream)
+
+    logger.info("Grüße.")
+    logger.update_prefix("präfix")
+    logger.warning("Updated.")
+
+    lines = stream.getvalue().decode("utf-8").splitlines()
+    assert lines[0].endswith(" - INFO - [bytes] Grüße.")
+    assert lines[1].endswith(" - WARNING - [präfix] Updated.")